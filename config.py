@@ -9,6 +9,61 @@ Description: Configuration management for different environments
 
 import os
 from datetime import timedelta
+from dotenv import load_dotenv
+
+# Load .env before the class attributes below read the environment
+load_dotenv()
+
+
+def get_worker_count():
+    """Get the number of gunicorn worker processes
+    
+    Returns:
+        WEB_CONCURRENCY if set, otherwise 2 * CPU + 1
+    """
+    return int(os.getenv('WEB_CONCURRENCY', 2 * os.cpu_count() + 1))
+
+
+def get_thread_count():
+    """Get the number of request threads per gunicorn worker
+    
+    Returns:
+        GUNICORN_THREADS if set, otherwise 4
+    """
+    return int(os.getenv('GUNICORN_THREADS', 4))
+
+
+def get_engine_options():
+    """Get SQLAlchemy engine options for a single worker process
+    
+    DB_POOL_SIZE and DB_MAX_OVERFLOW are the connection budget for the whole
+    host and are split across the gunicorn workers so that the total stays
+    within Postgres max_connections. DB_POOL_SIZE defaults to one connection
+    per request thread (workers * threads) and DB_MAX_OVERFLOW to 0.
+    
+    Returns:
+        Dictionary of keyword arguments for create_engine
+        
+    Raises:
+        ValueError: If DB_POOL_SIZE cannot give every request thread a connection
+    """
+    workers = get_worker_count()
+    threads = get_thread_count()
+    pool_budget = int(os.getenv('DB_POOL_SIZE', workers * threads))
+    overflow_budget = int(os.getenv('DB_MAX_OVERFLOW', 0))
+    if pool_budget < workers * threads:
+        raise ValueError(
+            f'DB_POOL_SIZE ({pool_budget}) is below WEB_CONCURRENCY * GUNICORN_THREADS '
+            f'({workers} * {threads} = {workers * threads}); raise DB_POOL_SIZE or lower '
+            f'the worker or thread count so every request thread has a connection'
+        )
+    return {
+        'pool_size': pool_budget // workers,
+        'max_overflow': max(0, overflow_budget) // workers,
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 30)),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        'pool_pre_ping': True
+    }
 
 
 class Config:
@@ -26,9 +81,33 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False
+    SQLALCHEMY_ENGINE_OPTIONS = get_engine_options()
+    SQLALCHEMY_BINDS = {
+        'replica': os.getenv('DATABASE_REPLICA_URL', SQLALCHEMY_DATABASE_URI)
+    }
     
     # Redis Configuration
+    # REDIS_URL only holds evictable cache entries (maxmemory-policy allkeys-lru)
     REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+    # Token blocklist must never be evicted: separate instance with maxmemory-policy noeviction.
+    # Falls back to REDIS_URL (with a warning at startup) when not set
+    JWT_BLOCKLIST_REDIS_URL = os.getenv('JWT_BLOCKLIST_REDIS_URL', REDIS_URL)
+    
+    # Cache Configuration
+    CACHE_TYPE = 'RedisCache'
+    CACHE_REDIS_URL = REDIS_URL
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv('CACHE_DEFAULT_TIMEOUT', 300))
+    CACHE_KEY_PREFIX = 'hcr:'
+    
+    # Rate Limiting Configuration
+    RATELIMIT_STORAGE_URI = os.getenv('RATELIMIT_STORAGE_URI', JWT_BLOCKLIST_REDIS_URL)
+    RATELIMIT_DEFAULT = os.getenv('RATELIMIT_DEFAULT', '200/minute')
+    RATELIMIT_SWALLOW_ERRORS = True
+    RATELIMIT_IN_MEMORY_FALLBACK_ENABLED = True
+    
+    # Reverse proxies in front of the API, trusted for X-Forwarded-For/-Proto.
+    # 0 (the default) ignores those headers; only set it behind a load balancer
+    PROXY_HOPS = int(os.getenv('PROXY_HOPS', 0))
     
     # JWT Configuration
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'jwt-secret-key-change-in-production')
@@ -41,6 +120,13 @@ class Config:
     # CORS Configuration
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', '*').split(',')
     
+    # Compression Configuration
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_BR_LEVEL = 4
+    COMPRESS_LEVEL = 4
+    COMPRESS_MIN_SIZE = 500
+    COMPRESS_MIMETYPES = ['application/json']
+    
     # Session Configuration
     PERMANENT_SESSION_LIFETIME = timedelta(hours=24)
     SESSION_COOKIE_SECURE = os.getenv('SESSION_COOKIE_SECURE', 'True') == 'True'
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Healthcare Risk Platform - Flask Extensions
+Author: Healthcare Systems Team
+Version: 1.0.0
+Description: Extension instances shared by the application factory and blueprints
+"""
+import logging
+import time
+import redis
+from flask import abort
+from flask_caching import Cache
+from flask_compress import Compress
+from flask_jwt_extended import JWTManager
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Redis-backed cache for read-heavy endpoints (configured in create_app)
+cache = Cache()
+
+# Redis connection for token revocation, kept apart from the LRU-evicting cache instance
+redis_client = redis.Redis.from_url(
+    Config.JWT_BLOCKLIST_REDIS_URL, socket_connect_timeout=2, socket_timeout=2
+)
+
+jwt = JWTManager()
+
+# Brotli/gzip compression for JSON responses
+compress = Compress()
+
+# Rate limits are stored in Redis so they hold across gunicorn workers
+limiter = Limiter(key_func=get_remote_address)
+
+
+@jwt.token_in_blocklist_loader
+def is_token_revoked(jwt_header, jwt_payload):
+    """Check the Redis blocklist for a revoked token
+    
+    Fails closed with 503 while the blocklist is unreachable, since a token
+    that cannot be checked may have been revoked.
+    """
+    try:
+        return bool(redis_client.exists(f"bl:{jwt_payload['jti']}"))
+    except redis.RedisError as e:
+        logger.error(f'Token blocklist unavailable: {e}')
+        abort(503)
+
+
+def revoke_token(jwt_payload):
+    """Add a token to the Redis blocklist until it would have expired anyway"""
+    ttl = max(int(jwt_payload['exp'] - time.time()), 1)
+    try:
+        redis_client.setex(f"bl:{jwt_payload['jti']}", ttl, 1)
+    except redis.RedisError as e:
+        logger.error(f'Token blocklist unavailable: {e}')
+        abort(503)
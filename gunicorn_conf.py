@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Healthcare Risk Platform - Gunicorn Configuration
+Author: Healthcare Systems Team
+Version: 1.0.0
+Description: Production WSGI server settings (gunicorn -c gunicorn_conf.py wsgi:application)
+"""
+import os
+from config import get_thread_count, get_worker_count
+
+# Server socket
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('API_PORT', 5000)}"
+
+# Worker processes (2 * CPU + 1 by default)
+workers = get_worker_count()
+# Each worker overlaps blocking database I/O across its threads; the
+# per-worker pool is sized to at least this many connections (config.get_engine_options)
+worker_class = 'gthread'
+threads = get_thread_count()
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 30))
+keepalive = 5
+
+# Load the application in the master so workers share it copy-on-write
+preload_app = True
+
+# Logging
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'INFO').lower()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Healthcare Risk Platform - JSON Serialization
+Author: Healthcare Systems Team
+Version: 1.0.0
+Description: orjson-backed JSON provider and response helper
+"""
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+# Naive datetimes are stored as UTC throughout the models
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson
+    
+    orjson serializes datetime, date, UUID and dataclasses natively; anything
+    else falls back to DefaultJSONProvider.default (e.g. Decimal).
+    """
+    # Keep payload key order and never pretty-print, even in debug mode
+    sort_keys = False
+    compact = True
+    
+    def _options(self, indent=False):
+        option = ORJSON_OPTIONS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+    
+    def dumps(self, obj, **kwargs):
+        option = self._options(indent=kwargs.get('indent') is not None)
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        # orjson has no object_hook, which TaggedJSONSerializer needs for session cookies
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._options(indent=indent)),
+            mimetype=self.mimetype
+        )
+
+
+def dump_json(payload):
+    """Encode a payload to JSON bytes"""
+    return orjson.dumps(payload, default=DefaultJSONProvider.default, option=ORJSON_OPTIONS)
+
+
+def json_response(payload, status=200):
+    """Build a JSON response from a payload or from already encoded JSON bytes"""
+    body = payload if isinstance(payload, bytes) else dump_json(payload)
+    return Response(body, status=status, mimetype='application/json')
@@ -6,15 +6,107 @@ Author: Healthcare Systems Team
 Version: 1.0.0
 Description: SQLAlchemy ORM models for the Healthcare Risk Platform
 """
-from datetime import datetime
-from sqlalchemy import Index, CheckConstraint
+import csv
+import io
+from contextlib import contextmanager
+from itertools import groupby
+from sqlalchemy import DDL, Index, CheckConstraint, Computed, event
+from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from sqlalchemy.orm import Session
 from flask_sqlalchemy import SQLAlchemy
-from werkzeug.security import generate_password_hash, check_password_hash
-import uuid
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerifyMismatchError
+from uuid6 import uuid7
 
 db = SQLAlchemy()
 
+# Argon2id hasher shared by all users (password_hash holds the full encoded parameters)
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=2)
+# Fixed hash verified for unknown usernames so login timing does not reveal which accounts exist
+_DUMMY_PASSWORD_HASH = _password_hasher.hash('healthcare-risk-platform-dummy-password')
+
+
+def utc_now():
+    """Server-side UTC timestamp for naive DateTime columns (now() is in the session time zone)"""
+    return func.timezone('utc', func.now())
+
+
+@contextmanager
+def read_session():
+    """Session bound to the read replica for reporting and aggregate queries"""
+    session = Session(bind=db.engines['replica'])
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _isoformat(value):
+    """Serialize an optional date/datetime as an ISO 8601 string"""
+    return value.isoformat() if value is not None else None
+
+
+class BulkInsertMixin:
+    """Bulk ingest helpers for high-frequency time-series tables"""
+    # Batches at or above this size are streamed with COPY FROM STDIN
+    COPY_THRESHOLD = 10000
+
+    @classmethod
+    def bulk_create(cls, rows):
+        """Insert a list of column dictionaries without building ORM instances
+
+        Commits the session and returns the number of rows inserted.
+        """
+        if len(rows) >= cls.COPY_THRESHOLD:
+            cls._copy_rows(rows)
+        else:
+            db.session.bulk_insert_mappings(cls, rows)
+        db.session.commit()
+        return len(rows)
+
+    @classmethod
+    def _copy_rows(cls, rows):
+        """Stream rows into the table with Postgres COPY, bypassing SQLAlchemy"""
+        table = cls.__table__
+        rows = [cls._with_python_defaults(row) for row in rows]
+
+        def row_columns(row):
+            return tuple(column.name for column in table.columns if column.name in row)
+
+        with db.session.connection().connection.cursor() as cursor:
+            # Rows are grouped by key set so omitted columns still receive their server defaults
+            for columns, group in groupby(sorted(rows, key=row_columns), key=row_columns):
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows([row[name] for name in columns] for row in group)
+                buffer.seek(0)
+                cursor.copy_expert(
+                    f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer
+                )
+
+    @classmethod
+    def _with_python_defaults(cls, row):
+        """Apply Python-side column defaults (e.g. the UUID primary key) that COPY cannot"""
+        row = dict(row)
+        for column in cls.__table__.columns:
+            default = column.default
+            if column.name not in row and default is not None:
+                row[column.name] = default.arg(None) if default.is_callable else default.arg
+        return row
+
+
+def default_partition(table_name):
+    """DDL for the DEFAULT partition that catches rows outside the monthly partitions
+
+    Monthly partitions and retention (DATA_RETENTION_DAYS) are managed by
+    pg_partman, e.g. partman.create_parent('public.vital_signs',
+    'measurement_time', 'native', 'monthly', p_default_table := false).
+    Expired months are removed with DETACH PARTITION instead of DELETE.
+    """
+    return DDL(f'CREATE TABLE IF NOT EXISTS {table_name}_default PARTITION OF {table_name} DEFAULT')
+
+
 class User(db.Model):
     """User model for authentication and authorization"""
     __tablename__ = 'users'
@@ -22,7 +114,7 @@ class User(db.Model):
         Index('idx_username', 'username'),
         Index('idx_email', 'email'),
     )
-    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
     password_hash = db.Column(db.String(255), nullable=False)
@@ -31,15 +123,41 @@ class User(db.Model):
     role = db.Column(db.String(20), default='viewer')  # admin, clinician, viewer
     is_active = db.Column(db.Boolean, default=True)
     is_verified = db.Column(db.Boolean, default=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
+    updated_at = db.Column(db.DateTime, server_default=utc_now(), onupdate=utc_now())
     last_login = db.Column(db.DateTime)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = _password_hasher.hash(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        """Verify a password, upgrading legacy or outdated hashes in place
+
+        The caller is responsible for committing the session so that a
+        rehashed password_hash is persisted.
+        """
+        if not self.password_hash.startswith('$argon2'):
+            # Legacy werkzeug hash (pbkdf2:/scrypt:), replaced with Argon2 on the first successful login
+            if not check_password_hash(self.password_hash, password):
+                return False
+            self.set_password(password)
+            return True
+        try:
+            _password_hasher.verify(self.password_hash, password)
+        except (VerifyMismatchError, InvalidHashError):
+            return False
+        if _password_hasher.check_needs_rehash(self.password_hash):
+            self.set_password(password)
+        return True
+
+    @staticmethod
+    def check_dummy_password(password):
+        """Spend the same Argon2 verify cost as check_password when no user matched"""
+        try:
+            _password_hasher.verify(_DUMMY_PASSWORD_HASH, password)
+        except VerifyMismatchError:
+            pass
+        return False
 
     def __repr__(self):
         return f'<User(id={self.id}, username={self.username})>'
@@ -52,7 +170,7 @@ class Patient(db.Model):
         Index('idx_mrn', 'mrn'),
         Index('idx_date_of_birth', 'date_of_birth'),
     )
-    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     mrn = db.Column(db.String(50), unique=True, nullable=False)  # Medical Record Number
     first_name = db.Column(db.String(50), nullable=False)
     last_name = db.Column(db.String(50), nullable=False)
@@ -73,25 +191,60 @@ class Patient(db.Model):
     admission_date = db.Column(db.DateTime)
     discharge_date = db.Column(db.DateTime)
     is_active = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
+    updated_at = db.Column(db.DateTime, server_default=utc_now(), onupdate=utc_now())
+
+    def to_dict(self):
+        return {
+            'id': str(self.id),
+            'mrn': self.mrn,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'date_of_birth': _isoformat(self.date_of_birth),
+            'gender': self.gender,
+            'phone': self.phone,
+            'email': self.email,
+            'address': self.address,
+            'city': self.city,
+            'state': self.state,
+            'zip_code': self.zip_code,
+            'emergency_contact': self.emergency_contact,
+            'emergency_phone': self.emergency_phone,
+            'insurance_id': self.insurance_id,
+            'comorbidities': self.comorbidities or [],
+            'allergies': self.allergies or [],
+            'current_medications': self.current_medications or {},
+            'admission_date': _isoformat(self.admission_date),
+            'discharge_date': _isoformat(self.discharge_date),
+            'is_active': self.is_active,
+            'created_at': _isoformat(self.created_at),
+            'updated_at': _isoformat(self.updated_at)
+        }
 
     def __repr__(self):
         return f'<Patient(id={self.id}, mrn={self.mrn}, first_name={self.first_name})>'
 
 
-class Vital(db.Model):
+class Vital(BulkInsertMixin, db.Model):
     """Vital signs model for storing patient measurements"""
     __tablename__ = 'vital_signs'
     __table_args__ = (
-        Index('idx_patient_id_timestamp', 'patient_id', 'measurement_time'),
+        # Covers "latest vitals" reads without heap fetches
+        Index(
+            'idx_vitals_patient_time_desc',
+            'patient_id',
+            db.text('measurement_time DESC'),
+            postgresql_include=('heart_rate', 'systolic_bp', 'oxygen_saturation')
+        ),
         CheckConstraint('heart_rate >= 0 AND heart_rate <= 300'),
         CheckConstraint('systolic_bp >= 50 AND systolic_bp <= 300'),
         CheckConstraint('diastolic_bp >= 30 AND diastolic_bp <= 200'),
+        {'postgresql_partition_by': 'RANGE (measurement_time)'},
     )
-    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # The partition key must be part of the primary key on a partitioned table
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     patient_id = db.Column(UUID(as_uuid=True), db.ForeignKey('patients.id'), nullable=False)
-    measurement_time = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    measurement_time = db.Column(db.DateTime, primary_key=True, server_default=utc_now())
     heart_rate = db.Column(db.Integer)  # BPM
     systolic_bp = db.Column(db.Integer)  # mmHg
     diastolic_bp = db.Column(db.Integer)  # mmHg
@@ -100,58 +253,125 @@ class Vital(db.Model):
     oxygen_saturation = db.Column(db.Float)  # %
     blood_glucose = db.Column(db.Float)  # mg/dL
     weight = db.Column(db.Float)  # kg
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
     patient = db.relationship('Patient', backref=db.backref('vitals', lazy=True))
 
+    def to_dict(self):
+        return {
+            'id': str(self.id),
+            'patient_id': str(self.patient_id),
+            'measurement_time': _isoformat(self.measurement_time),
+            'heart_rate': self.heart_rate,
+            'systolic_bp': self.systolic_bp,
+            'diastolic_bp': self.diastolic_bp,
+            'respiratory_rate': self.respiratory_rate,
+            'temperature': self.temperature,
+            'oxygen_saturation': self.oxygen_saturation,
+            'blood_glucose': self.blood_glucose,
+            'weight': self.weight,
+            'created_at': _isoformat(self.created_at)
+        }
+
     def __repr__(self):
         return f'<Vital(id={self.id}, patient_id={self.patient_id}, heart_rate={self.heart_rate})>'
 
 
-class LabResult(db.Model):
+class LabResult(BulkInsertMixin, db.Model):
     """Laboratory test results model"""
     __tablename__ = 'lab_results'
     __table_args__ = (
         Index('idx_patient_id_test_date', 'patient_id', 'test_date'),
+        {'postgresql_partition_by': 'RANGE (test_date)'},
     )
-    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # The partition key must be part of the primary key on a partitioned table
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     patient_id = db.Column(UUID(as_uuid=True), db.ForeignKey('patients.id'), nullable=False)
     test_name = db.Column(db.String(100), nullable=False)  # WBC, RBC, etc
     test_value = db.Column(db.Float)
     unit = db.Column(db.String(50))
     reference_low = db.Column(db.Float)
     reference_high = db.Column(db.Float)
-    test_date = db.Column(db.DateTime, nullable=False)
+    test_date = db.Column(db.DateTime, primary_key=True)
     lab_name = db.Column(db.String(100))
     status = db.Column(db.String(20), default='pending')  # pending, completed, reviewed
     notes = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
     patient = db.relationship('Patient', backref=db.backref('lab_results', lazy=True))
 
+    def to_dict(self):
+        return {
+            'id': str(self.id),
+            'patient_id': str(self.patient_id),
+            'test_name': self.test_name,
+            'test_value': self.test_value,
+            'unit': self.unit,
+            'reference_low': self.reference_low,
+            'reference_high': self.reference_high,
+            'test_date': _isoformat(self.test_date),
+            'lab_name': self.lab_name,
+            'status': self.status,
+            'notes': self.notes,
+            'created_at': _isoformat(self.created_at)
+        }
+
     def __repr__(self):
         return f'<LabResult(id={self.id}, patient_id={self.patient_id}, test_name={self.test_name})>'
 
 
+event.listen(Vital.__table__, 'after_create', default_partition('vital_signs'))
+event.listen(LabResult.__table__, 'after_create', default_partition('lab_results'))
+
+
+# Risk category bucketing for risk_score (0-100), computed by Postgres on write
+RISK_CATEGORY_SQL = (
+    "CASE WHEN risk_score >= 80 THEN 'critical' "
+    "WHEN risk_score >= 60 THEN 'high' "
+    "WHEN risk_score >= 30 THEN 'medium' "
+    "ELSE 'low' END"
+)
+
+
 class RiskAssessment(db.Model):
     """Risk assessment scores model"""
     __tablename__ = 'risk_assessments'
     __table_args__ = (
         Index('idx_patient_id_assessment_date', 'patient_id', 'assessment_date'),
+        Index(
+            'idx_ra_critical',
+            db.text('assessment_date DESC'),
+            postgresql_where=db.text("risk_category IN ('high', 'critical')")
+        ),
         CheckConstraint('risk_score >= 0 AND risk_score <= 100'),
     )
-    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     patient_id = db.Column(UUID(as_uuid=True), db.ForeignKey('patients.id'), nullable=False)
-    assessment_date = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    assessment_date = db.Column(db.DateTime, server_default=utc_now(), nullable=False)
     risk_score = db.Column(db.Float, nullable=False)  # 0-100
-    risk_category = db.Column(db.String(20))  # low, medium, high, critical
+    risk_category = db.Column(db.String(20), Computed(RISK_CATEGORY_SQL, persisted=True))  # low, medium, high, critical
     clinical_factors = db.Column(JSONB, default={})
     alert_triggered = db.Column(db.Boolean, default=False)
     alert_message = db.Column(db.Text)
     assessment_type = db.Column(db.String(50))  # readmission, mortality, etc
     created_by = db.Column(UUID(as_uuid=True), db.ForeignKey('users.id'))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
     patient = db.relationship('Patient', backref=db.backref('risk_assessments', lazy=True))
     clinician = db.relationship('User', backref=db.backref('assessments', lazy=True))
 
+    def to_dict(self):
+        return {
+            'id': str(self.id),
+            'patient_id': str(self.patient_id),
+            'assessment_date': _isoformat(self.assessment_date),
+            'risk_score': self.risk_score,
+            'risk_category': self.risk_category,
+            'clinical_factors': self.clinical_factors or {},
+            'alert_triggered': self.alert_triggered,
+            'alert_message': self.alert_message,
+            'assessment_type': self.assessment_type,
+            'created_by': str(self.created_by) if self.created_by else None,
+            'created_at': _isoformat(self.created_at)
+        }
+
     def __repr__(self):
         return f'<RiskAssessment(id={self.id}, patient_id={self.patient_id}, risk_score={self.risk_score}, risk_category={self.risk_category})>'
 
@@ -161,9 +381,15 @@ class Alert(db.Model):
     __tablename__ = 'alerts'
     __table_args__ = (
         Index('idx_patient_id_created_at', 'patient_id', 'created_at'),
-        Index('idx_status', 'status'),
+        # Covers the "active alerts, newest first" dashboard query
+        Index(
+            'idx_alert_status_created',
+            'status',
+            db.text('created_at DESC'),
+            postgresql_include=('patient_id', 'severity', 'title')
+        ),
     )
-    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     patient_id = db.Column(UUID(as_uuid=True), db.ForeignKey('patients.id'), nullable=False)
     alert_type = db.Column(db.String(50), nullable=False)  # critical, warning, info
     title = db.Column(db.String(200), nullable=False)
@@ -173,7 +399,7 @@ class Alert(db.Model):
     acknowledged_by = db.Column(UUID(as_uuid=True), db.ForeignKey('users.id'))
     acknowledged_at = db.Column(db.DateTime)
     resolved_at = db.Column(db.DateTime)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
     patient = db.relationship('Patient', backref=db.backref('alerts', lazy=True))
     clinician = db.relationship('User', backref=db.backref('acknowledged_alerts', lazy=True))
 
@@ -187,7 +413,7 @@ class Intervention(db.Model):
     __table_args__ = (
         Index('idx_patient_id_intervention_date', 'patient_id', 'intervention_date'),
     )
-    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     patient_id = db.Column(UUID(as_uuid=True), db.ForeignKey('patients.id'), nullable=False)
     intervention_type = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text)
@@ -195,7 +421,7 @@ class Intervention(db.Model):
     outcome = db.Column(db.String(50))  # successful, unsuccessful, ongoing
     clinician_id = db.Column(UUID(as_uuid=True), db.ForeignKey('users.id'))
     notes = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
     patient = db.relationship('Patient', backref=db.backref('interventions', lazy=True))
     clinician = db.relationship('User', backref=db.backref('interventions', lazy=True))
 
@@ -1,9 +1,283 @@
 """Flask blueprints for the Healthcare Risk Platform."""
-from flask import Blueprint
-
-# Initialize blueprints
-api_bp = Blueprint('api', __name__, url_prefix='/api')
-auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
-patient_bp = Blueprint('patient', __name__, url_prefix='/patient')
-risk_bp = Blueprint('risk', __name__, url_prefix='/risk')
-report_bp = Blueprint('report', __name__, url_prefix='/report')
+import logging
+from datetime import datetime, timedelta, timezone
+import psycopg2
+from flask import Blueprint, abort, jsonify, request
+from flask_jwt_extended import create_access_token, create_refresh_token, get_jwt, jwt_required
+from sqlalchemy.exc import DataError, IntegrityError, ProgrammingError
+from config import Config
+from extensions import cache, limiter, revoke_token
+from models import db, utc_now, User, Patient, RiskAssessment, Vital, LabResult
+from tasks import celery, generate_report
+
+logger = logging.getLogger(__name__)
+
+# Initialize blueprints (URL prefixes are set once, at registration in app.py)
+api_bp = Blueprint('api', __name__)
+auth_bp = Blueprint('auth', __name__)
+patient_bp = Blueprint('patient', __name__)
+risk_bp = Blueprint('risk', __name__)
+report_bp = Blueprint('report', __name__)
+
+# Seconds a cached read stays valid before falling back to Postgres
+CACHE_TIMEOUT = 300
+
+# Reporting windows for the predefined report types
+REPORT_PERIODS = {
+    'daily': timedelta(days=1),
+    'weekly': timedelta(weeks=1),
+    'monthly': timedelta(days=30)
+}
+
+# Vital sign fields accepted by the batch ingest endpoint
+VITAL_FIELDS = (
+    'measurement_time', 'heart_rate', 'systolic_bp', 'diastolic_bp', 'respiratory_rate',
+    'temperature', 'oxygen_saturation', 'blood_glucose', 'weight'
+)
+# Fields stored in Integer columns; floats are rejected rather than rounded by Postgres
+VITAL_INTEGER_FIELDS = frozenset(('heart_rate', 'systolic_bp', 'diastolic_bp', 'respiratory_rate'))
+
+
+# Cached reads
+@cache.memoize(CACHE_TIMEOUT)
+def load_patient_page(page, per_page):
+    """Load one page of patients as serialized dictionaries"""
+    pagination = Patient.query.order_by(Patient.last_name, Patient.first_name).paginate(
+        page=page, per_page=per_page, error_out=False
+    )
+    return {
+        'patients': [patient.to_dict() for patient in pagination.items],
+        'pagination': {
+            'page': pagination.page,
+            'per_page': pagination.per_page,
+            'total': pagination.total,
+            'pages': pagination.pages
+        }
+    }
+
+
+def _latest(model, time_column, patient_id):
+    """Newest rows of a patient time series, bounded to MAX_ITEMS_PER_PAGE in SQL"""
+    rows = (
+        model.query.filter_by(patient_id=patient_id)
+        .order_by(time_column.desc())
+        .limit(Config.MAX_ITEMS_PER_PAGE)
+        .all()
+    )
+    return [row.to_dict() for row in rows]
+
+
+@cache.memoize(CACHE_TIMEOUT)
+def load_patient(mrn):
+    """Load a patient with their latest vitals, lab results and risk assessments, or None"""
+    patient = Patient.query.filter_by(mrn=mrn).first()
+    if patient is None:
+        return None
+    # Each window is an index scan on (patient_id, time), never the full history
+    return {
+        **patient.to_dict(),
+        'vitals': _latest(Vital, Vital.measurement_time, patient.id),
+        'lab_results': _latest(LabResult, LabResult.test_date, patient.id),
+        'risk_assessments': _latest(RiskAssessment, RiskAssessment.assessment_date, patient.id)
+    }
+
+
+@cache.memoize(CACHE_TIMEOUT)
+def load_risk_assessments(patient_id):
+    """Load the most recent risk assessments for a patient"""
+    return _latest(RiskAssessment, RiskAssessment.assessment_date, patient_id)
+
+
+def parse_timestamp(value):
+    """Parse an ISO 8601 string as a naive UTC datetime, or return None if it is not one"""
+    if not isinstance(value, str):
+        return None
+    try:
+        value = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def parse_vital(row):
+    """Validate one batch row, returning its column values or None if a value has the wrong type
+
+    measurement_time must be an ISO 8601 string (stored as naive UTC), the
+    VITAL_INTEGER_FIELDS must be integers or null, and every other field must
+    be a number or null.
+    """
+    vital = {}
+    for field in VITAL_FIELDS:
+        if field not in row:
+            continue
+        value = row[field]
+        if field == 'measurement_time':
+            value = parse_timestamp(value)
+            if value is None:
+                return None
+        elif value is not None:
+            allowed = int if field in VITAL_INTEGER_FIELDS else (int, float)
+            if isinstance(value, bool) or not isinstance(value, allowed):
+                return None
+        vital[field] = value
+    return vital
+
+
+def invalidate_patient_cache(patient):
+    """Drop cached reads for a patient after any write that touches it"""
+    cache.delete_memoized(load_patient, patient.mrn)
+    cache.delete_memoized(load_risk_assessments, patient.id)
+    cache.delete_memoized(load_patient_page)
+
+
+# Authentication endpoints
+@auth_bp.route('/login', methods=['POST'])
+@limiter.limit('5/minute')
+def login():
+    """Exchange a username (or email) and password for JWT tokens"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        abort(400, description='Expected a JSON object with username and password.')
+    username = data.get('username')
+    password = data.get('password')
+    if not isinstance(username, str) or not isinstance(password, str) or not username or not password:
+        abort(400, description='Both username and password are required as strings.')
+    user = User.query.filter((User.username == username) | (User.email == username)).first()
+    if user is None:
+        User.check_dummy_password(password)
+        abort(401)
+    # Verify before checking is_active so disabled accounts cost the same as active ones
+    if not user.check_password(password) or not user.is_active:
+        abort(401)
+    user.last_login = utc_now()
+    db.session.commit()
+    identity = str(user.id)
+    return jsonify({
+        'success': True,
+        'access_token': create_access_token(identity=identity, additional_claims={'role': user.role}),
+        'refresh_token': create_refresh_token(identity=identity)
+    }), 200
+
+
+@auth_bp.route('/logout', methods=['POST'])
+@jwt_required(verify_type=False)
+def logout():
+    """Revoke the presented access or refresh token"""
+    revoke_token(get_jwt())
+    return jsonify({'success': True, 'message': 'Token revoked'}), 200
+
+
+# Patient endpoints
+@patient_bp.route('', methods=['GET'])
+@jwt_required()
+def list_patients():
+    """List patients, paginated by ?page= and ?per_page="""
+    page = request.args.get('page', 1, type=int)
+    per_page = min(
+        request.args.get('per_page', Config.ITEMS_PER_PAGE, type=int),
+        Config.MAX_ITEMS_PER_PAGE
+    )
+    return jsonify({'success': True, **load_patient_page(max(page, 1), max(per_page, 1))}), 200
+
+
+@patient_bp.route('/<mrn>', methods=['GET'])
+@jwt_required()
+def get_patient(mrn):
+    """Get patient details by Medical Record Number"""
+    patient = load_patient(mrn)
+    if patient is None:
+        abort(404)
+    return jsonify({'success': True, 'patient': patient}), 200
+
+
+@patient_bp.route('/<uuid:patient_id>/vitals/batch', methods=['POST'])
+@jwt_required()
+def create_vitals_batch(patient_id):
+    """Ingest a JSON array of vital sign measurements for a patient"""
+    if not Config.FEATURE_BATCH_PROCESSING:
+        abort(404)
+    rows = request.get_json(silent=True)
+    if not isinstance(rows, list) or not rows or not all(isinstance(row, dict) for row in rows):
+        abort(400, description='Expected a non-empty JSON array of vital sign measurements.')
+    vitals = []
+    for index, row in enumerate(rows):
+        vital = parse_vital(row)
+        if vital is None:
+            abort(400, description=f'Invalid value types in vital sign measurement {index}.')
+        vitals.append({**vital, 'patient_id': patient_id})
+    patient = db.session.get(Patient, patient_id)
+    if patient is None:
+        abort(404)
+    try:
+        created = Vital.bulk_create(vitals)
+    except (
+        DataError, IntegrityError, ProgrammingError,
+        psycopg2.DataError, psycopg2.IntegrityError, psycopg2.ProgrammingError
+    ) as e:
+        db.session.rollback()
+        # The driver error quotes the failing row, so it stays in the server log
+        logger.warning(f'Rejected vital sign batch for patient {patient_id}: {e}')
+        abort(400, description='Invalid vital sign measurements: a value is out of range or malformed.')
+    invalidate_patient_cache(patient)
+    return jsonify({'success': True, 'created': created}), 201
+
+
+# Risk endpoints
+@risk_bp.route('/<uuid:patient_id>', methods=['GET'])
+@jwt_required()
+def get_risk(patient_id):
+    """Get the risk assessment history for a patient, newest first"""
+    return jsonify({
+        'success': True,
+        'patient_id': str(patient_id),
+        'assessments': load_risk_assessments(patient_id)
+    }), 200
+
+
+# Report endpoints
+@report_bp.route('', methods=['POST'])
+@jwt_required()
+def create_report():
+    """Queue report generation on a Celery worker and return its task id"""
+    data = request.get_json(silent=True)
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        abort(400, description='Expected a JSON object describing the report.')
+    report_type = data.get('report_type', 'daily')
+    if not isinstance(report_type, str):
+        abort(400, description='report_type must be a string.')
+    if report_type == 'custom':
+        # Stored timestamps are naive UTC, so offset-aware bounds are converted first
+        start = parse_timestamp(data.get('start_date'))
+        end = parse_timestamp(data.get('end_date'))
+        if start is None or end is None:
+            abort(400, description='Custom reports require ISO 8601 start_date and end_date.')
+        if start >= end:
+            abort(400, description='start_date must be before end_date.')
+    elif report_type in REPORT_PERIODS:
+        end = datetime.utcnow()
+        start = end - REPORT_PERIODS[report_type]
+    else:
+        abort(400, description=f'Unknown report_type: {report_type}')
+    task = generate_report.delay({
+        'report_type': report_type,
+        'start_date': start.isoformat(),
+        'end_date': end.isoformat()
+    })
+    return jsonify({'success': True, 'task_id': task.id}), 202
+
+
+@report_bp.route('/<task_id>', methods=['GET'])
+@jwt_required()
+def get_report(task_id):
+    """Poll a queued report; the report is included once the task has succeeded"""
+    result = celery.AsyncResult(task_id)
+    response = {'success': True, 'task_id': task_id, 'state': result.state}
+    if result.successful():
+        response['report'] = result.result
+    elif result.failed():
+        response['success'] = False
+    return jsonify(response), 200
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Healthcare Risk Platform - Background Tasks
+Author: Healthcare Systems Team
+Version: 1.0.0
+Description: Celery worker tasks (celery -A tasks.celery worker)
+"""
+from datetime import datetime
+from celery import Celery, Task
+from sqlalchemy import func, select
+from config import Config
+
+
+class FlaskTask(Task):
+    """Celery task that runs inside the Flask application context"""
+    
+    def __call__(self, *args, **kwargs):
+        from app import app
+        with app.app_context():
+            return self.run(*args, **kwargs)
+
+
+celery = Celery(
+    __name__,
+    broker=Config.CELERY_BROKER_URL,
+    backend=Config.CELERY_RESULT_BACKEND,
+    task_cls=FlaskTask
+)
+celery.conf.update(
+    task_serializer=Config.CELERY_TASK_SERIALIZER,
+    result_serializer=Config.CELERY_RESULT_SERIALIZER,
+    accept_content=Config.CELERY_ACCEPT_CONTENT,
+    timezone=Config.CELERY_TIMEZONE
+)
+
+
+@celery.task
+def generate_report(params):
+    """Aggregate risk assessments and alerts for a reporting window
+    
+    Args:
+        params: Dictionary with report_type and ISO 8601 start_date/end_date
+        
+    Returns:
+        JSON-serializable report dictionary
+    """
+    from models import read_session, Alert, RiskAssessment
+    start = datetime.fromisoformat(params['start_date'])
+    end = datetime.fromisoformat(params['end_date'])
+    
+    # Aggregates run on the read replica to keep scans off the primary
+    with read_session() as session:
+        assessments = session.execute(
+            select(
+                RiskAssessment.risk_category,
+                func.count(RiskAssessment.id),
+                func.avg(RiskAssessment.risk_score)
+            )
+            .where(RiskAssessment.assessment_date >= start, RiskAssessment.assessment_date < end)
+            .group_by(RiskAssessment.risk_category)
+        ).all()
+        alerts = session.execute(
+            select(Alert.severity, Alert.status, func.count(Alert.id))
+            .where(Alert.created_at >= start, Alert.created_at < end)
+            .group_by(Alert.severity, Alert.status)
+        ).all()
+    
+    return {
+        'report_type': params['report_type'],
+        'start_date': params['start_date'],
+        'end_date': params['end_date'],
+        'risk_categories': {
+            category: {'assessments': count, 'average_risk_score': round(average, 2)}
+            for category, count, average in assessments
+        },
+        'alerts': [
+            {'severity': severity, 'status': status, 'count': count}
+            for severity, status, count in alerts
+        ],
+        'generated_at': datetime.utcnow().isoformat()
+    }
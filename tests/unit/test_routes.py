@@ -0,0 +1,8 @@
+"""Routing regression tests for the Healthcare Risk Platform API."""
+from app import app
+
+
+def test_patients_list_resolves_without_double_prefix():
+    endpoint, arguments = app.url_map.bind('').match('/api/patients')
+    assert endpoint == 'patient.list_patients'
+    assert arguments == {}
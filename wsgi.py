@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Healthcare Risk Platform - WSGI Entry Point
+Author: Healthcare Systems Team
+Version: 1.0.0
+Description: WSGI callable for production servers (gunicorn -c gunicorn_conf.py wsgi:application)
+"""
+from app import app
+
+application = app